@@ -1,15 +1,78 @@
 import tkinter as tk
 import tkinter.font as tkfont
-from tkinter import ttk, messagebox, colorchooser
+from tkinter import ttk, messagebox, colorchooser, simpledialog
 from tkcalendar import Calendar, DateEntry
 import sqlite3
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import re
-
-DB_FILE = "tasks.db"
+import heapq
+import itertools
+import argparse
+import time
+import zlib
+import os
+import glob
+import threading
+import functools
+import random
+import json
+import base64
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+DEFAULT_DB_FILE = "tasks.db"
+DB_FILE = DEFAULT_DB_FILE
+DEFAULT_WORKSPACE = "Default"
+ACTIVE_WORKSPACE = DEFAULT_WORKSPACE
+WORKSPACE_DIR = "workspaces"
+WORKSPACE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9 _-]{0,39}$")
+WORKSPACE_PAGE_SIZE = 100
+MAX_ATTACHED_WORKSPACES = 10
+SCHEMA_VERSION = 5
+DB_BUSY_TIMEOUT = 1.0
+WRITE_RETRY_LIMIT = 8
+WRITE_RETRY_BASE_DELAY = 0.02
+WRITE_RETRY_MAX_DELAY = 1.0
+STRESS_DB_FILE = "stress.db"
+STRESS_REORDER_BATCH = 20
+BACKUP_DIR = "backups"
+BACKUP_KEEP = 5
+BACKUP_INTERVAL_HOURS = 24
+BACKUP_PAGES_PER_STEP = 64
+BACKUP_STEP_SLEEP = 0.01
+BACKGROUND_POLL_MS = 100
+MAINTENANCE_STEP_PAGES = 256
+MAINTENANCE_STEP_MS = 50
+MAINTENANCE_IDLE_MS = 60000
 DEFAULT_PRIMARY_COLOR = "#FFA2B9"
 DEFAULT_SECONDARY_COLOR = "#FFD5DF"
 HEX_PATTERN = re.compile(r"^#([0-9A-Fa-f]{6})$")
+REMINDER_HORIZON_DAYS = 7
+REMINDER_LEAD_DAYS = 1
+REMINDER_HOUR = 9
+REMINDER_MAX_SLEEP_SECONDS = 60
+STATUS_KEY_SQL = "COALESCE({row}status, '')"
+WEEK_KEY_SQL = "COALESCE(date({row}due_date, '-6 days', 'weekday 1'), '')"
+SUMMARY_COLUMNS = "id, title, due_date, status, order_index, priority"
+PRIORITY_LEVELS = {"Low": 1, "Medium": 2, "High": 3}
+DEFAULT_PRIORITY = 2
+PRIORITY_DAY_WEIGHT = 3
+TOP_TASKS_LIMIT = 50
+JOURNAL_FIELDS = ("title", "description", "due_date", "status", "priority", "order_index")
+UNDO_LIMIT = 200
+QUICK_ADD_DATE_PATTERN = re.compile(r"(?:^|\s)@(\d\S*)")
+INSERT_TASK_SQL = """
+INSERT INTO tasks (title, description, due_date, status, priority, order_index)
+VALUES (?, ?, ?, ?, ?, COALESCE(?, MAX(COALESCE((SELECT MAX(order_index) FROM tasks), 0),
+                                        COALESCE((SELECT MAX(id) FROM tasks), 0)) + 1))
+"""
+URGENCY_SQL = (
+    "CASE {row}status WHEN 'Missed' THEN 0 WHEN 'Pending' THEN 1 WHEN 'Done' THEN 2 ELSE 3 END * 1000000"
+    " + COALESCE(CAST(julianday({row}due_date) AS INTEGER) - 2400000, 900000)"
+    f" - COALESCE({{row}}priority, {DEFAULT_PRIORITY}) * {PRIORITY_DAY_WEIGHT}"
+)
+DESCRIPTION_COMPRESS_THRESHOLD = 4096
 
 
 def is_valid_hex(color):
@@ -47,9 +110,89 @@ def blend_colors(color_a, color_b, alpha=0.5):
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+_write_stats = threading.local()
+_change_history = {}
+_connection_pool = {}
+_pool_lock = threading.Lock()
+
+
+class PooledConnection(sqlite3.Connection):
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+    def release(self):
+        super().close()
+
+
+def _pool_key(path=None):
+    return os.getpid(), threading.get_ident(), path or DB_FILE
+
+
+def connect_db():
+    key = _pool_key()
+    conn = _connection_pool.get(key)
+    if conn is None:
+        conn = sqlite3.connect(DB_FILE, timeout=DB_BUSY_TIMEOUT, factory=PooledConnection)
+        with _pool_lock:
+            _connection_pool[key] = conn
+    return conn
+
+
+def rollback_pooled_connection():
+    conn = _connection_pool.get(_pool_key())
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
+
+def release_thread_connections():
+    pid, thread_id, _ = _pool_key()
+    with _pool_lock:
+        keys = [key for key in _connection_pool if key[:2] == (pid, thread_id)]
+        conns = [_connection_pool.pop(key) for key in keys]
+    for conn in conns:
+        conn.release()
+
+
+def close_connection_pool(path=None):
+    with _pool_lock:
+        keys = [key for key in _connection_pool if path is None or key[2] == path]
+        conns = [_connection_pool.pop(key) for key in keys]
+    for conn in conns:
+        try:
+            conn.release()
+        except sqlite3.Error:
+            pass
+
+
+def lock_retry_count():
+    return getattr(_write_stats, "retries", 0)
+
+
+def retry_on_locked(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(WRITE_RETRY_LIMIT + 1):
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                rollback_pooled_connection()
+                message = str(exc)
+                if (attempt == WRITE_RETRY_LIMIT or not isinstance(exc, sqlite3.OperationalError)
+                        or ("locked" not in message and "busy" not in message)):
+                    raise
+            _write_stats.retries = lock_retry_count() + 1
+            delay = min(WRITE_RETRY_MAX_DELAY, WRITE_RETRY_BASE_DELAY * 2 ** attempt)
+            time.sleep(random.uniform(delay / 2, delay))
+    return wrapper
+
+
+@retry_on_locked
 def init_db():
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
+    cur.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    cur.execute("PRAGMA journal_mode = WAL")
     cur.execute("""
     CREATE TABLE IF NOT EXISTS tasks (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -57,7 +200,9 @@ def init_db():
         description TEXT,
         due_date TEXT,
         status TEXT,
-        order_index INTEGER DEFAULT 0
+        order_index INTEGER DEFAULT 0,
+        priority INTEGER DEFAULT 2,
+        urgency INTEGER
     )
     """)
     conn.commit()
@@ -69,96 +214,647 @@ def init_db():
             cur.execute("ALTER TABLE tasks ADD COLUMN order_index INTEGER DEFAULT 0")
         except sqlite3.OperationalError:
             pass
+    if "priority" not in cols:
+        try:
+            cur.execute(f"ALTER TABLE tasks ADD COLUMN priority INTEGER DEFAULT {DEFAULT_PRIORITY}")
+        except sqlite3.OperationalError:
+            pass
+    if "urgency" not in cols:
+        try:
+            cur.execute("ALTER TABLE tasks ADD COLUMN urgency INTEGER")
+        except sqlite3.OperationalError:
+            pass
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_sort_due ON tasks (COALESCE(due_date, '9999-12-31'), id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_urgency ON tasks (urgency, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tasks_order_index ON tasks (order_index)")
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_urgency_insert AFTER INSERT ON tasks BEGIN
+        UPDATE tasks SET urgency = {URGENCY_SQL.format(row="NEW.")} WHERE id = NEW.id;
+    END
+    """)
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_urgency_update AFTER UPDATE OF status, due_date, priority ON tasks BEGIN
+        UPDATE tasks SET urgency = {URGENCY_SQL.format(row="NEW.")} WHERE id = NEW.id;
+    END
+    """)
+    conn.commit()
+
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_status_counts'")
+    stats_exist = cur.fetchone() is not None
+    cur.execute("PRAGMA user_version")
+    if cur.fetchone()[0] < 5:
+        for trigger in ("tasks_stats_insert", "tasks_stats_delete", "tasks_stats_update"):
+            cur.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    create_stats_schema(cur)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS task_journal (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        recorded_at TEXT NOT NULL,
+        op TEXT NOT NULL,
+        task_id INTEGER,
+        payload TEXT NOT NULL,
+        origin TEXT NOT NULL DEFAULT 'user'
+    )
+    """)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS journal_sync_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        source_seq INTEGER NOT NULL,
+        source_epoch TEXT
+    )
+    """)
+    cur.execute("PRAGMA table_info(journal_sync_state)")
+    if "source_epoch" not in [c[1] for c in cur.fetchall()]:
+        cur.execute("ALTER TABLE journal_sync_state ADD COLUMN source_epoch TEXT")
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS journal_epoch (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        epoch TEXT NOT NULL
+    )
+    """)
+    cur.execute("INSERT OR IGNORE INTO journal_epoch (id, epoch) VALUES (1, ?)", (os.urandom(8).hex(),))
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS reminder_deliveries (
+        task_id INTEGER PRIMARY KEY,
+        fire_at TEXT NOT NULL
+    )
+    """)
+    conn.commit()
+
+    cur.execute("PRAGMA user_version")
+    version = cur.fetchone()[0]
+    if version < 2:
+        cur.execute("PRAGMA auto_vacuum")
+        if cur.fetchone()[0] != 2:
+            cur.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            cur.execute("VACUUM")
+    if version < 3:
+        cur.execute(f"UPDATE tasks SET urgency = {URGENCY_SQL.format(row='')}")
+    if version < SCHEMA_VERSION:
+        cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
     conn.close()
+    if not stats_exist:
+        rebuild_stats_db()
 
 
-def add_task_db(title, description, due_date, status="Pending", order_index=None):
-    conn = sqlite3.connect(DB_FILE)
+def create_stats_schema(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS task_status_counts (
+        status TEXT PRIMARY KEY,
+        task_count INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS task_week_counts (
+        week_start TEXT PRIMARY KEY,
+        task_count INTEGER NOT NULL DEFAULT 0,
+        done_count INTEGER NOT NULL DEFAULT 0
+    )
+    """)
+
+    def count_sql(row, sign):
+        status_key = STATUS_KEY_SQL.format(row=row)
+        week_key = WEEK_KEY_SQL.format(row=row)
+        return f"""
+        INSERT OR IGNORE INTO task_status_counts (status) VALUES ({status_key});
+        UPDATE task_status_counts SET task_count = task_count {sign} 1 WHERE status = {status_key};
+        INSERT OR IGNORE INTO task_week_counts (week_start) VALUES ({week_key});
+        UPDATE task_week_counts SET task_count = task_count {sign} 1,
+            done_count = done_count {sign} ({row}status IS 'Done')
+        WHERE week_start = {week_key};
+        """
+
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_stats_insert AFTER INSERT ON tasks BEGIN
+        {count_sql("NEW.", "+")}
+    END
+    """)
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_stats_delete AFTER DELETE ON tasks BEGIN
+        {count_sql("OLD.", "-")}
+    END
+    """)
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_stats_update AFTER UPDATE OF status, due_date ON tasks BEGIN
+        {count_sql("OLD.", "-")}
+        {count_sql("NEW.", "+")}
+    END
+    """)
+
+
+@retry_on_locked
+def rebuild_stats_db():
+    conn = connect_db()
     cur = conn.cursor()
-    if order_index is None:
-        cur.execute("INSERT INTO tasks (title, description, due_date, status) VALUES (?, ?, ?, ?)",
-                    (title, description, due_date, status))
-        conn.commit()
-        last_id = cur.lastrowid
-        try:
-            cur.execute("UPDATE tasks SET order_index = ? WHERE id = ?", (last_id, last_id))
-            conn.commit()
-        except Exception:
-            pass
+    cur.execute("DELETE FROM task_status_counts")
+    cur.execute("DELETE FROM task_week_counts")
+    cur.execute(f"""
+    INSERT INTO task_status_counts (status, task_count)
+    SELECT {STATUS_KEY_SQL.format(row="")}, COUNT(*) FROM tasks GROUP BY 1
+    """)
+    cur.execute(f"""
+    INSERT INTO task_week_counts (week_start, task_count, done_count)
+    SELECT {WEEK_KEY_SQL.format(row="")}, COUNT(*), SUM(status IS 'Done') FROM tasks GROUP BY 1
+    """)
+    conn.commit()
+    conn.close()
+
+
+def fetch_stats_db():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT status, task_count FROM task_status_counts WHERE task_count > 0 ORDER BY status")
+    status_rows = cur.fetchall()
+    cur.execute("SELECT week_start, task_count, done_count FROM task_week_counts WHERE task_count > 0 ORDER BY week_start")
+    week_rows = cur.fetchall()
+    conn.close()
+    return status_rows, week_rows
+
+
+def encode_description(text):
+    if not text:
+        return text
+    raw = text.encode("utf-8")
+    if len(raw) < DESCRIPTION_COMPRESS_THRESHOLD:
+        return text
+    packed = zlib.compress(raw)
+    return packed if len(packed) < len(raw) else text
+
+
+def decode_description(value):
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def _decode_rows(rows):
+    return [(tid, title, decode_description(desc), due_s, status, order_index)
+            for tid, title, desc, due_s, status, order_index in rows]
+
+
+def _history():
+    return _change_history.setdefault(DB_FILE, {"undo": deque(maxlen=UNDO_LIMIT), "redo": []})
+
+
+def _pack_value(value):
+    if isinstance(value, bytes):
+        return {"zlib": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _unpack_value(value):
+    if isinstance(value, dict):
+        return base64.b64decode(value["zlib"])
+    return value
+
+
+def _fetch_task_fields(cur, task_id, fields=JOURNAL_FIELDS):
+    cur.execute(f"SELECT {', '.join(fields)} FROM tasks WHERE id = ?", (task_id,))
+    row = cur.fetchone()
+    if row is None:
+        return None
+    return {field: _pack_value(value) for field, value in zip(fields, row)}
+
+
+def _record_change(cur, op, task_id, payload, origin="user"):
+    cur.execute("INSERT INTO task_journal (recorded_at, op, task_id, payload, origin) VALUES (?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), op, task_id,
+                 json.dumps(payload, separators=(",", ":")), origin))
+    return cur.lastrowid
+
+
+def _remember_changes(seqs):
+    if seqs:
+        history = _history()
+        history["undo"].append(tuple(seqs))
+        history["redo"].clear()
+
+
+def _apply_change(cur, op, task_id, payload, origin):
+    if op == "insert":
+        row = payload["row"]
+        cols = ("id",) + JOURNAL_FIELDS
+        cur.execute(f"INSERT INTO tasks ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})",
+                    [task_id] + [_unpack_value(row.get(field)) for field in JOURNAL_FIELDS])
+    elif op == "delete":
+        cur.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+    elif op == "update":
+        fields = [field for field in payload["after"] if field in JOURNAL_FIELDS]
+        cur.execute(f"UPDATE tasks SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?",
+                    [_unpack_value(payload["after"][field]) for field in fields] + [task_id])
+    elif op == "reorder":
+        cur.executemany("UPDATE tasks SET order_index = ? WHERE id = ?", [(oi, tid) for tid, oi in payload["after"]])
     else:
-        cur.execute("INSERT INTO tasks (title, description, due_date, status, order_index) VALUES (?, ?, ?, ?, ?)",
-                    (title, description, due_date, status, order_index))
-        conn.commit()
+        raise ValueError(f"Unknown journal operation: {op}")
+    return _record_change(cur, op, task_id, payload, origin)
+
+
+def _invert_change(op, payload):
+    if op == "insert":
+        return "delete", payload
+    if op == "delete":
+        return "insert", payload
+    return op, {"before": payload["after"], "after": payload["before"]}
+
+
+def _fetch_journal_entries(cur, seqs):
+    entries = []
+    for seq in seqs:
+        cur.execute("SELECT op, task_id, payload FROM task_journal WHERE seq = ?", (seq,))
+        op, task_id, payload = cur.fetchone()
+        entries.append((op, task_id, json.loads(payload)))
+    return entries
+
+
+@retry_on_locked
+def undo_last_change():
+    history = _history()
+    if not history["undo"]:
+        return None
+    group = history["undo"][-1]
+    conn = connect_db()
+    cur = conn.cursor()
+    entries = _fetch_journal_entries(cur, group)
+    for op, task_id, payload in reversed(entries):
+        inverse_op, inverse_payload = _invert_change(op, payload)
+        _apply_change(cur, inverse_op, task_id, inverse_payload, "undo")
+    conn.commit()
+    conn.close()
+    history["undo"].pop()
+    history["redo"].append(group)
+    return entries
+
+
+@retry_on_locked
+def redo_last_change():
+    history = _history()
+    if not history["redo"]:
+        return None
+    group = history["redo"][-1]
+    conn = connect_db()
+    cur = conn.cursor()
+    entries = _fetch_journal_entries(cur, group)
+    for op, task_id, payload in entries:
+        _apply_change(cur, op, task_id, payload, "redo")
+    conn.commit()
     conn.close()
+    history["redo"].pop()
+    history["undo"].append(group)
+    return entries
+
+
+def describe_changes(entries):
+    if len(entries) == 1:
+        op, task_id, _ = entries[0]
+        return f"{op} of task #{task_id}" if task_id is not None else op
+    return f"{len(entries)} changes"
+
+
+def iter_journal(since_seq=0):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT epoch FROM journal_epoch WHERE id = 1")
+    epoch = cur.fetchone()[0]
+    cur.execute("SELECT seq, recorded_at, op, task_id, payload, origin FROM task_journal WHERE seq > ? ORDER BY seq",
+                (since_seq,))
+    for seq, recorded_at, op, task_id, payload, origin in cur:
+        yield {"epoch": epoch, "seq": seq, "recorded_at": recorded_at, "op": op, "task_id": task_id,
+               "payload": json.loads(payload), "origin": origin}
+    conn.close()
+
+
+def export_journal(out, since_seq=0):
+    count = 0
+    for entry in iter_journal(since_seq):
+        out.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+@retry_on_locked
+def apply_journal_entries(entries):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT source_seq, source_epoch FROM journal_sync_state WHERE id = 1")
+    row = cur.fetchone()
+    synced_seq = row[0] if row else 0
+    if row is None:
+        cur.execute("SELECT 1 FROM tasks LIMIT 1")
+        if cur.fetchone() is not None:
+            raise ValueError("The target database already has tasks; replicate into an empty database.")
+    epochs = {entry.get("epoch") for entry in entries}
+    if len(epochs) > 1 or None in epochs:
+        raise ValueError("The journal does not carry a single source epoch; export it again.")
+    epoch = epochs.pop() if epochs else None
+    if row is not None and row[1] is not None and epoch is not None and epoch != row[1]:
+        raise ValueError("The journal comes from a different source, or the source was restored from a snapshot "
+                         "since the last sync; replicate into a new empty database.")
+    cur.execute("SELECT 1 FROM task_journal WHERE origin IN ('user', 'undo', 'redo') LIMIT 1")
+    if cur.fetchone() is not None:
+        raise ValueError("The target database has local edits; journal sync only replicates into a read-only copy.")
+    pending = [entry for entry in entries if entry["seq"] > synced_seq]
+    if pending and pending[0]["seq"] != synced_seq + 1:
+        raise ValueError(f"The journal starts at seq {pending[0]['seq']} but this copy has applied "
+                         f"through seq {synced_seq}; export again with --export-journal {synced_seq}.")
+    try:
+        for entry in pending:
+            _apply_change(cur, entry["op"], entry["task_id"], entry["payload"], "sync")
+    except sqlite3.IntegrityError as exc:
+        raise ValueError(f"Journal entry {entry['seq']} conflicts with the target database: {exc}")
+    if pending:
+        cur.execute("INSERT OR REPLACE INTO journal_sync_state (id, source_seq, source_epoch) VALUES (1, ?, ?)",
+                    (pending[-1]["seq"], epoch))
+    conn.commit()
+    conn.close()
+    return len(pending), synced_seq + len(pending)
+
+
+@retry_on_locked
+def renew_journal_epoch():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("UPDATE journal_epoch SET epoch = ? WHERE id = 1", (os.urandom(8).hex(),))
+    conn.commit()
+    conn.close()
+
+
+@retry_on_locked
+def trim_journal_db(through_seq):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("DELETE FROM task_journal WHERE seq <= ?", (through_seq,))
+    removed = cur.rowcount
+    conn.commit()
+    conn.close()
+    history = _history()
+    history["undo"] = deque((group for group in history["undo"] if min(group) > through_seq), maxlen=UNDO_LIMIT)
+    history["redo"] = [group for group in history["redo"] if min(group) > through_seq]
+    return removed
+
+
+@retry_on_locked
+def add_task_db(title, description, due_date, status="Pending", order_index=None, priority=DEFAULT_PRIORITY):
+    description = encode_description(description)
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(INSERT_TASK_SQL, (title, description, due_date, status, priority, order_index))
+    last_id = cur.lastrowid
+    seq = _record_change(cur, "insert", last_id, {"row": _fetch_task_fields(cur, last_id)})
+    conn.commit()
+    conn.close()
+    _remember_changes([seq])
+    return last_id
+
+
+@retry_on_locked
+def add_tasks_db(items, status="Pending", priority=DEFAULT_PRIORITY):
+    conn = connect_db()
+    cur = conn.cursor()
+    ids = []
+    seqs = []
+    for title, due_date in items:
+        cur.execute(INSERT_TASK_SQL, (title, None, due_date, status, priority, None))
+        ids.append(cur.lastrowid)
+        seqs.append(_record_change(cur, "insert", ids[-1], {"row": _fetch_task_fields(cur, ids[-1])}))
+    conn.commit()
+    conn.close()
+    _remember_changes(seqs)
+    return ids
+
+
+def parse_quick_add(text):
+    items = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        due_s = None
+        match = QUICK_ADD_DATE_PATTERN.search(line)
+        if match:
+            due_d = iso_to_date(match.group(1))
+            if due_d is None:
+                raise ValueError(f"Line {line_no}: '{match.group(1)}' is not a YYYY-MM-DD date.")
+            due_s = due_d.isoformat()
+            line = (line[:match.start()] + line[match.end():]).strip()
+        if not line:
+            raise ValueError(f"Line {line_no}: a title is required.")
+        items.append((line, due_s))
+    return items
 
 
 def fetch_all_tasks_db():
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
     cur.execute("SELECT id, title, description, due_date, status, order_index FROM tasks")
     rows = cur.fetchall()
     conn.close()
-    return rows
+    return _decode_rows(rows)
 
 
 def fetch_tasks_by_statuses(statuses):
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
     placeholders = ",".join("?" for _ in statuses)
     query = f"SELECT id, title, description, due_date, status, order_index FROM tasks WHERE status IN ({placeholders})"
     cur.execute(query, tuple(statuses))
     rows = cur.fetchall()
     conn.close()
-    return rows
+    return _decode_rows(rows)
 
 
 def fetch_tasks_by_date(due_date_str):
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
     cur.execute("SELECT id, title, description, due_date, status, order_index FROM tasks WHERE due_date = ?", (due_date_str,))
     rows = cur.fetchall()
     conn.close()
+    return _decode_rows(rows)
+
+
+def fetch_all_task_summaries_db():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(f"SELECT {SUMMARY_COLUMNS} FROM tasks")
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def fetch_task_summaries_by_statuses(statuses):
+    conn = connect_db()
+    cur = conn.cursor()
+    placeholders = ",".join("?" for _ in statuses)
+    cur.execute(f"SELECT {SUMMARY_COLUMNS} FROM tasks WHERE status IN ({placeholders})", tuple(statuses))
+    rows = cur.fetchall()
+    conn.close()
     return rows
 
 
+def fetch_task_summaries_by_date(due_date_str):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(f"SELECT {SUMMARY_COLUMNS} FROM tasks WHERE due_date = ?", (due_date_str,))
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def fetch_task_summaries_between(start_str, end_str):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(f"SELECT {SUMMARY_COLUMNS} FROM tasks WHERE due_date >= ? AND due_date < ? ORDER BY due_date, id",
+                (start_str, end_str))
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def fetch_top_tasks_db(limit=TOP_TASKS_LIMIT):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(f"SELECT {SUMMARY_COLUMNS} FROM tasks ORDER BY urgency, id LIMIT ?", (limit,))
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def fetch_task_description_db(task_id):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT description FROM tasks WHERE id = ?", (task_id,))
+    row = cur.fetchone()
+    conn.close()
+    return decode_description(row[0]) if row else None
+
+
+def fetch_due_soon_db(start_str, end_str):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT id, title, due_date, status FROM tasks WHERE status != 'Done' AND due_date BETWEEN ? AND ?",
+                (start_str, end_str))
+    rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def database_data_version():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("PRAGMA data_version")
+    version = cur.fetchone()[0]
+    conn.close()
+    return version
+
+
+@retry_on_locked
+def load_reminder_deliveries_db(cutoff):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("DELETE FROM reminder_deliveries WHERE fire_at <= ?", (cutoff.isoformat(),))
+    cur.execute("SELECT task_id, fire_at FROM reminder_deliveries")
+    rows = cur.fetchall()
+    conn.commit()
+    conn.close()
+    return {tid: datetime.fromisoformat(fire_at) for tid, fire_at in rows}
+
+
+@retry_on_locked
+def record_reminder_delivery_db(task_id, fire_at):
+    conn = connect_db()
+    cur = conn.cursor()
+    if fire_at is None:
+        cur.execute("DELETE FROM reminder_deliveries WHERE task_id = ?", (task_id,))
+    else:
+        cur.execute("INSERT OR REPLACE INTO reminder_deliveries (task_id, fire_at) VALUES (?, ?)",
+                    (task_id, fire_at.isoformat()))
+    conn.commit()
+    conn.close()
+
+
+@retry_on_locked
 def update_task_status_db(task_id, new_status):
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
+    before = _fetch_task_fields(cur, task_id, ("status",))
+    if before is None or before["status"] == new_status:
+        conn.close()
+        return
     cur.execute("UPDATE tasks SET status = ? WHERE id = ?", (new_status, task_id))
+    seq = _record_change(cur, "update", task_id, {"before": before, "after": {"status": new_status}})
     conn.commit()
     conn.close()
+    _remember_changes([seq])
 
 
-def update_task_db(task_id, title, description, due_date, status):
-    conn = sqlite3.connect(DB_FILE)
+@retry_on_locked
+def update_task_db(task_id, title, description, due_date, status, priority=None):
+    description = encode_description(description)
+    conn = connect_db()
     cur = conn.cursor()
+    before = _fetch_task_fields(cur, task_id, ("title", "description", "due_date", "status", "priority"))
+    if before is None:
+        conn.close()
+        return
+    after = {"title": title, "description": _pack_value(description), "due_date": due_date, "status": status,
+             "priority": before["priority"] if priority is None else priority}
+    changed = [field for field in after if after[field] != before[field]]
+    if not changed:
+        conn.close()
+        return
     cur.execute("""
-    UPDATE tasks SET title = ?, description = ?, due_date = ?, status = ? WHERE id = ?
-    """, (title, description, due_date, status, task_id))
+    UPDATE tasks SET title = ?, description = ?, due_date = ?, status = ?, priority = COALESCE(?, priority) WHERE id = ?
+    """, (title, description, due_date, status, priority, task_id))
+    seq = _record_change(cur, "update", task_id, {"before": {field: before[field] for field in changed},
+                                                  "after": {field: after[field] for field in changed}})
     conn.commit()
     conn.close()
+    _remember_changes([seq])
 
 
+@retry_on_locked
 def delete_task_db(task_id):
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
+    row = _fetch_task_fields(cur, task_id)
+    if row is None:
+        conn.close()
+        return
     cur.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+    seq = _record_change(cur, "delete", task_id, {"row": row})
     conn.commit()
     conn.close()
+    _remember_changes([seq])
 
 
+@retry_on_locked
 def set_task_order_indices(pairs):
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
-    cur.executemany("UPDATE tasks SET order_index = ? WHERE id = ?", [(oi, tid) for (tid, oi) in pairs])
+    new_order = dict(pairs)
+    old_order = {}
+    ids = list(new_order)
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        cur.execute(f"SELECT id, order_index FROM tasks WHERE id IN ({','.join('?' for _ in chunk)})", chunk)
+        old_order.update(cur.fetchall())
+    changed = [tid for tid in ids if tid in old_order and old_order[tid] != new_order[tid]]
+    if not changed:
+        conn.close()
+        return
+    cur.executemany("UPDATE tasks SET order_index = ? WHERE id = ?", [(new_order[tid], tid) for tid in changed])
+    seq = _record_change(cur, "reorder", None, {"before": [[tid, old_order[tid]] for tid in changed],
+                                                "after": [[tid, new_order[tid]] for tid in changed]})
     conn.commit()
     conn.close()
+    _remember_changes([seq])
 
 
+@retry_on_locked
 def mark_missed_tasks():
     today = date.today()
-    conn = sqlite3.connect(DB_FILE)
+    conn = connect_db()
     cur = conn.cursor()
     cur.execute("SELECT id, due_date, status FROM tasks WHERE status != 'Done' AND due_date IS NOT NULL")
     rows = cur.fetchall()
@@ -172,11 +868,279 @@ def mark_missed_tasks():
         except Exception:
             continue
     if to_update:
+        statuses = {tid: status for tid, _, status in rows}
         cur.executemany("UPDATE tasks SET status='Missed' WHERE id = ?", [(tid,) for tid in to_update])
+        for tid in to_update:
+            _record_change(cur, "update", tid, {"before": {"status": statuses[tid]}, "after": {"status": "Missed"}}, "auto")
         conn.commit()
     conn.close()
 
 
+def database_health():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("PRAGMA page_count")
+    page_count = cur.fetchone()[0]
+    cur.execute("PRAGMA freelist_count")
+    freelist_count = cur.fetchone()[0]
+    conn.close()
+    return {
+        "file_bytes": sum(os.path.getsize(path) for path in (DB_FILE, DB_FILE + "-wal") if os.path.exists(path)),
+        "page_count": page_count,
+        "freelist_count": freelist_count,
+        "fragmentation": freelist_count / page_count if page_count else 0.0,
+    }
+
+
+@retry_on_locked
+def incremental_vacuum_step(pages=MAINTENANCE_STEP_PAGES):
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute(f"PRAGMA incremental_vacuum({int(pages)})")
+    cur.fetchall()
+    cur.execute("PRAGMA freelist_count")
+    remaining = cur.fetchone()[0]
+    conn.close()
+    return remaining
+
+
+@retry_on_locked
+def refresh_statistics():
+    conn = connect_db()
+    cur = conn.cursor()
+    cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+    if cur.fetchone() is None:
+        cur.execute("ANALYZE")
+    else:
+        cur.execute("PRAGMA optimize")
+    conn.commit()
+    cur.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+
+
+def run_maintenance():
+    before = database_health()
+    while incremental_vacuum_step() > 0:
+        pass
+    refresh_statistics()
+    return before, database_health()
+
+
+def format_maintenance_report(before, after):
+    return (f"File size {before['file_bytes'] / 1024:.1f} KB -> {after['file_bytes'] / 1024:.1f} KB, "
+            f"free pages {before['freelist_count']} -> {after['freelist_count']} "
+            f"(fragmentation {before['fragmentation']:.1%} -> {after['fragmentation']:.1%})")
+
+
+def workspace_path(name):
+    if name == DEFAULT_WORKSPACE:
+        return DEFAULT_DB_FILE
+    return os.path.join(WORKSPACE_DIR, f"{name}.db")
+
+
+def is_valid_workspace_name(name):
+    return bool(WORKSPACE_NAME_PATTERN.match(name or "")) and name != DEFAULT_WORKSPACE
+
+
+def list_workspaces():
+    names = [os.path.splitext(os.path.basename(path))[0] for path in glob.glob(os.path.join(WORKSPACE_DIR, "*.db"))]
+    return [DEFAULT_WORKSPACE] + sorted(name for name in names if name != DEFAULT_WORKSPACE)
+
+
+def set_active_workspace(name):
+    global DB_FILE, ACTIVE_WORKSPACE
+    if name != DEFAULT_WORKSPACE:
+        os.makedirs(WORKSPACE_DIR, exist_ok=True)
+    DB_FILE = workspace_path(name)
+    ACTIVE_WORKSPACE = name
+    init_db()
+
+
+def _fetch_workspace_group_page(names, after, limit):
+    conn = sqlite3.connect(":memory:", timeout=DB_BUSY_TIMEOUT)
+    cur = conn.cursor()
+    sort_due = "COALESCE(due_date, '9999-12-31')"
+    branches = []
+    params = []
+    for idx, name in enumerate(names):
+        cur.execute(f"ATTACH DATABASE ? AS ws{idx}", (workspace_path(name),))
+        where = ""
+        if after:
+            after_due, after_workspace, after_id = after
+            if name < after_workspace:
+                where, extra = f"WHERE {sort_due} > ?", [after_due]
+            elif name > after_workspace:
+                where, extra = f"WHERE {sort_due} >= ?", [after_due]
+            else:
+                where, extra = f"WHERE {sort_due} >= ? AND ({sort_due}, id) > (?, ?)", [after_due, after_due, after_id]
+            params.extend([name] + extra)
+        else:
+            params.append(name)
+        branches.append(f"""SELECT * FROM (
+            SELECT {sort_due} AS sort_due, ? AS workspace, id, title, due_date, status FROM ws{idx}.tasks
+            {where} ORDER BY {sort_due}, id LIMIT {int(limit)})""")
+    rows = []
+    if branches:
+        cur.execute(" UNION ALL ".join(branches) + f" ORDER BY sort_due, workspace, id LIMIT {int(limit)}", params)
+        rows = cur.fetchall()
+    conn.close()
+    return rows
+
+
+def fetch_cross_workspace_page(after=None, limit=WORKSPACE_PAGE_SIZE):
+    names = [name for name in list_workspaces() if os.path.exists(workspace_path(name))]
+    groups = [names[start:start + MAX_ATTACHED_WORKSPACES] for start in range(0, len(names), MAX_ATTACHED_WORKSPACES)]
+    pages = [_fetch_workspace_group_page(group, after, limit) for group in groups]
+    return list(itertools.islice(heapq.merge(*pages, key=lambda row: row[:3]), limit))
+
+
+def backup_db(dest_path, source_path=None, progress=None):
+    src = sqlite3.connect(source_path or DB_FILE, timeout=DB_BUSY_TIMEOUT)
+    dst = sqlite3.connect(dest_path, timeout=DB_BUSY_TIMEOUT)
+    try:
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP, progress=progress, sleep=BACKUP_STEP_SLEEP)
+    finally:
+        dst.close()
+        src.close()
+
+
+def snapshot_dir():
+    if ACTIVE_WORKSPACE == DEFAULT_WORKSPACE:
+        return BACKUP_DIR
+    return os.path.join(BACKUP_DIR, WORKSPACE_DIR, ACTIVE_WORKSPACE)
+
+
+def _snapshot_path(stamp):
+    stem = os.path.splitext(os.path.basename(DB_FILE))[0]
+    return os.path.join(snapshot_dir(), f"{stem}-{stamp}.db")
+
+
+def list_snapshots():
+    stamp_pattern = "[0-9]" * 8 + "-" + "[0-9]" * 6
+    return sorted(glob.glob(_snapshot_path(stamp_pattern)), reverse=True)
+
+
+def prune_snapshots(keep=BACKUP_KEEP):
+    for path in list_snapshots()[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def create_snapshot(progress=None):
+    os.makedirs(snapshot_dir(), exist_ok=True)
+    path = _snapshot_path(datetime.now().strftime("%Y%m%d-%H%M%S"))
+    partial = path + ".part"
+    backup_db(partial, progress=progress)
+    os.replace(partial, path)
+    prune_snapshots()
+    return path
+
+
+def snapshot_is_due():
+    snapshots = list_snapshots()
+    if not snapshots:
+        return True
+    age = time.time() - os.path.getmtime(snapshots[0])
+    return age >= BACKUP_INTERVAL_HOURS * 3600
+
+
+def snapshot_schema_version(path):
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        cur = conn.cursor()
+        cur.execute("PRAGMA quick_check")
+        if cur.fetchone()[0] != "ok":
+            return None
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks'")
+        if cur.fetchone() is None:
+            return None
+        cur.execute("PRAGMA user_version")
+        return cur.fetchone()[0]
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def restore_snapshot(path, progress=None):
+    version = snapshot_schema_version(path)
+    if version is None:
+        raise ValueError(f"{os.path.basename(path)} is not a valid task database snapshot.")
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"{os.path.basename(path)} uses schema version {version}, "
+                         f"newer than this application supports ({SCHEMA_VERSION}).")
+    backup_db(DB_FILE, source_path=path, progress=progress)
+    _change_history.pop(DB_FILE, None)
+    init_db()
+    renew_journal_epoch()
+
+
+def _stress_worker(db_path, ops, seed):
+    global DB_FILE
+    DB_FILE = db_path
+    rng = random.Random(seed)
+    created = []
+    latencies = []
+    errors = 0
+    retries_before = lock_retry_count()
+    try:
+        for _ in range(ops):
+            roll = rng.random()
+            started = time.perf_counter()
+            try:
+                if roll < 0.4 or not created:
+                    created.append(add_task_db(f"Stress task {seed}-{len(created)}", "", date.today().strftime("%Y-%m-%d")))
+                elif roll < 0.8:
+                    update_task_status_db(rng.choice(created), rng.choice(["Pending", "Done", "Missed"]))
+                else:
+                    sample = rng.sample(created, min(len(created), STRESS_REORDER_BATCH))
+                    set_task_order_indices([(tid, rng.randint(1, 100000)) for tid in sample])
+            except sqlite3.OperationalError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+    finally:
+        release_thread_connections()
+    return latencies, lock_retry_count() - retries_before, errors
+
+
+def run_stress_test(db_path=STRESS_DB_FILE, workers=4, ops_per_worker=200, use_processes=False):
+    global DB_FILE
+    previous_db = DB_FILE
+    DB_FILE = db_path
+    try:
+        init_db()
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        started = time.perf_counter()
+        with executor_cls(max_workers=workers) as pool:
+            results = list(pool.map(_stress_worker, [db_path] * workers, [ops_per_worker] * workers, range(workers)))
+        elapsed = time.perf_counter() - started
+    finally:
+        DB_FILE = previous_db
+
+    latencies = sorted(lat for lats, _, _ in results for lat in lats)
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000 if latencies else 0.0
+
+    return {
+        "mode": "processes" if use_processes else "threads",
+        "workers": workers,
+        "operations": len(latencies),
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "lock_retries": sum(retries for _, retries, _ in results),
+        "errors": sum(errs for _, _, errs in results),
+    }
+
+
 def center_window(win, w, h):
     win.update_idletasks()
     sw = win.winfo_screenwidth()
@@ -186,6 +1150,13 @@ def center_window(win, w, h):
     win.geometry(f"{w}x{h}+{x}+{y}")
 
 
+def priority_name(value):
+    for name, level in PRIORITY_LEVELS.items():
+        if level == value:
+            return name
+    return priority_name(DEFAULT_PRIORITY)
+
+
 def iso_to_date(value):
     try:
         return datetime.strptime(value, "%Y-%m-%d").date()
@@ -193,6 +1164,128 @@ def iso_to_date(value):
         return None
 
 
+def reminder_fire_time(due_value):
+    due_d = iso_to_date(due_value)
+    if due_d is None:
+        return None
+    return datetime.combine(due_d - timedelta(days=REMINDER_LEAD_DAYS), datetime.min.time()).replace(hour=REMINDER_HOUR)
+
+
+def reminder_expiry_time(due_value):
+    due_d = iso_to_date(due_value)
+    if due_d is None:
+        return None
+    return datetime.combine(due_d + timedelta(days=1), datetime.min.time())
+
+
+def print_reminder(task_id, title, due_s):
+    print(f"[{datetime.now():%Y-%m-%d %H:%M}] Reminder: task #{task_id} \"{title}\" is due {due_s}.", flush=True)
+
+
+class ReminderScheduler:
+    def __init__(self, notify, root=None, horizon_days=REMINDER_HORIZON_DAYS):
+        self.notify = notify
+        self.root = root
+        self.horizon = timedelta(days=horizon_days)
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._after_id = None
+        self._loaded_until = None
+        self._data_version = None
+        self._fired = {}
+
+    def load(self):
+        now = datetime.now()
+        self._heap = []
+        self._entries = {}
+        self._data_version = database_data_version()
+        self._fired = load_reminder_deliveries_db(now - timedelta(days=REMINDER_LEAD_DAYS + 1))
+        self._loaded_until = now + self.horizon
+        end = (self._loaded_until + timedelta(days=REMINDER_LEAD_DAYS)).date()
+        for tid, title, due_s, status in fetch_due_soon_db(now.date().strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")):
+            self._push(tid, title, due_s, status, now)
+        self._arm()
+
+    def schedule(self, task_id, title, due_s, status):
+        if self._loaded_until is None:
+            return
+        self._push(task_id, title, due_s, status, datetime.now())
+        self._arm()
+
+    def cancel(self, task_id):
+        self._discard(task_id)
+        self._arm()
+
+    def _push(self, task_id, title, due_s, status, now):
+        self._discard(task_id)
+        if status == "Done":
+            return
+        fire_at = reminder_fire_time(due_s)
+        if fire_at is None or fire_at > self._loaded_until or now >= reminder_expiry_time(due_s):
+            return
+        fired_at = self._fired.get(task_id)
+        if fired_at == fire_at:
+            return
+        if fired_at is not None:
+            del self._fired[task_id]
+            record_reminder_delivery_db(task_id, None)
+        entry = [fire_at, next(self._counter), task_id, title, due_s, True]
+        self._entries[task_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _discard(self, task_id):
+        entry = self._entries.pop(task_id, None)
+        if entry:
+            entry[-1] = False
+
+    def _peek(self):
+        while self._heap and not self._heap[0][-1]:
+            heapq.heappop(self._heap)
+        return self._heap[0] if self._heap else None
+
+    def next_delay(self):
+        wake_at = self._loaded_until
+        top = self._peek()
+        if top and top[0] < wake_at:
+            wake_at = top[0]
+        seconds = (wake_at - datetime.now()).total_seconds()
+        return max(0.0, min(seconds, REMINDER_MAX_SLEEP_SECONDS))
+
+    def _arm(self):
+        if self.root is None or self._loaded_until is None:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._after_id = self.root.after(int(self.next_delay() * 1000), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self.fire_due()
+        self._arm()
+
+    def fire_due(self):
+        now = datetime.now()
+        if now >= self._loaded_until or database_data_version() != self._data_version:
+            self.load()
+        top = self._peek()
+        while top and top[0] <= now:
+            heapq.heappop(self._heap)
+            fire_at, _, tid, title, due_s, _ = top
+            del self._entries[tid]
+            self._fired[tid] = fire_at
+            record_reminder_delivery_db(tid, fire_at)
+            if now < reminder_expiry_time(due_s):
+                self.notify(tid, title, due_s)
+            top = self._peek()
+
+    def run_forever(self):
+        self.load()
+        while True:
+            time.sleep(self.next_delay())
+            self.fire_due()
+
+
 class TaskApp:
     def __init__(self, root):
         self.root = root
@@ -238,6 +1331,15 @@ class TaskApp:
         self.header.pack(fill="x", padx=12, pady=(12, 8))
         self.header_title = ttk.Label(self.header, text="🗂️ Task Management System", style="HeaderTitle.TLabel")
         self.header_title.pack(side="left")
+        ttk.Button(self.header, text="↶ Undo", command=self.undo_change, style="Secondary.TButton").pack(side="left", padx=(16, 4))
+        ttk.Button(self.header, text="↷ Redo", command=self.redo_change, style="Secondary.TButton").pack(side="left", padx=4)
+
+        self.workspace_var = tk.StringVar(value=ACTIVE_WORKSPACE)
+        ttk.Button(self.header, text="New", command=self.create_workspace, style="Secondary.TButton").pack(side="right", padx=(6, 0))
+        self.workspace_box = ttk.Combobox(self.header, textvariable=self.workspace_var, state="readonly", width=18)
+        self.workspace_box.pack(side="right")
+        self.workspace_box.bind("<<ComboboxSelected>>", lambda _evt: self.switch_workspace(self.workspace_var.get()))
+        ttk.Label(self.header, text="Workspace:", style="HeaderText.TLabel").pack(side="right", padx=(0, 6))
 
         main = ttk.Frame(self.root, style="Surface.TFrame")
         main.pack(fill="both", expand=True, padx=12, pady=(0, 12))
@@ -253,14 +1355,91 @@ class TaskApp:
         self._add_menu_button("Add Task", self.open_add_task)
         self._add_menu_button("Update Task", self.open_update_task)
         self._add_menu_button("To-Do List", self.open_todo_list)
+        self._add_menu_button("Statistics", self.open_stats)
+        self._add_menu_button("All Workspaces", self.open_all_workspaces)
         self._add_menu_button("Settings", self.open_settings)
 
         ttk.Separator(self.menu, orient="horizontal").pack(fill="x", pady=10)
         self._add_menu_button("Exit", self.on_exit, style_name="Secondary.TButton")
 
+        self._idle_job = None
+        self._maintenance = None
+        self.last_maintenance_report = None
+        self.root.bind_all("<Any-KeyPress>", self._note_activity, add="+")
+        self.root.bind_all("<Any-ButtonPress>", self._note_activity, add="+")
+
         init_db()
+        self.workspace_box.configure(values=list_workspaces())
+        self.reminders = ReminderScheduler(self.notify_reminder, root=self.root)
+        self.reminders.load()
         self.apply_theme()
         self.show_welcome()
+        if snapshot_is_due():
+            self.root.after(5000, self.start_backup)
+        self._note_activity()
+
+    def run_in_background(self, work, on_done, on_poll=None):
+        result = {}
+
+        def worker():
+            try:
+                result["value"] = work()
+            except Exception as exc:
+                result["error"] = exc
+            finally:
+                release_thread_connections()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+
+        def poll():
+            if on_poll:
+                on_poll()
+            if thread.is_alive():
+                self.root.after(BACKGROUND_POLL_MS, poll)
+            else:
+                on_done(result.get("value"), result.get("error"))
+
+        self.root.after(BACKGROUND_POLL_MS, poll)
+
+    def start_backup(self, on_done=None, on_progress=None):
+        progress = {"remaining": 0, "total": 0}
+
+        def record(status, remaining, total):
+            progress["remaining"] = remaining
+            progress["total"] = total
+
+        def report():
+            if on_progress and progress["total"]:
+                on_progress(progress["total"] - progress["remaining"], progress["total"])
+
+        self.run_in_background(lambda: create_snapshot(progress=record),
+                               on_done or (lambda path, error: None), report)
+
+    def _note_activity(self, _event=None):
+        if self._idle_job is not None:
+            self.root.after_cancel(self._idle_job)
+        if self._maintenance is not None:
+            self.root.after_cancel(self._maintenance["job"])
+            self._maintenance = None
+        self._idle_job = self.root.after(MAINTENANCE_IDLE_MS, self._start_idle_maintenance)
+
+    def _start_idle_maintenance(self):
+        self._idle_job = None
+        self._maintenance = {"db": DB_FILE, "before": database_health(), "job": None}
+        self._maintenance["job"] = self.root.after(0, self._maintenance_step)
+
+    def _maintenance_step(self):
+        state = self._maintenance
+        if state is None or state["db"] != DB_FILE:
+            self._maintenance = None
+            return
+        if incremental_vacuum_step() > 0:
+            state["job"] = self.root.after(MAINTENANCE_STEP_MS, self._maintenance_step)
+            return
+        refresh_statistics()
+        self.last_maintenance_report = format_maintenance_report(state["before"], database_health())
+        self._maintenance = None
 
     def _add_menu_button(self, text, command, style_name="MaterialNav.TButton"):
         btn = ttk.Button(self.menu, text=text, command=command, style=style_name)
@@ -273,13 +1452,13 @@ class TaskApp:
         self.surface_alt_color = blend_colors(self.secondary_color, "#FFFFFF", 0.88)
         self.nav_color = blend_colors(self.secondary_color, "#FFFFFF", 0.55)
         self.nav_hover = adjust_color(self.nav_color, -0.05)
-        self.checkbox_fill = adjust_color(self.primary_color, -0.18)
         self.status_palette = {
             "Missed": adjust_color(self.primary_color, -0.2),
             "Pending": blend_colors(self.secondary_color, "#FFF0C2", 0.55),
             "Done": "#B8F2C8",
         }
         self.root.configure(bg=self.secondary_color)
+        self._configure_status_styles()
 
         style = self.style
         style.configure("TFrame", background=self.surface_color)
@@ -290,6 +1469,7 @@ class TaskApp:
         style.configure("TLabel", background=self.surface_color, foreground=self.on_surface, font=self.font_body)
         style.configure("Heading.TLabel", background=self.surface_color, foreground=self.on_surface, font=self.font_heading)
         style.configure("HeaderTitle.TLabel", background=self.primary_color, foreground="#321725", font=self.font_title)
+        style.configure("HeaderText.TLabel", background=self.primary_color, foreground="#321725", font=self.font_body)
 
         style.configure("TButton", background=self.primary_color, foreground="#321725", padding=8, borderwidth=0, font=self.font_button)
         style.map("TButton",
@@ -323,6 +1503,55 @@ class TaskApp:
         if hasattr(self, "content"):
             self.content.configure(style="Surface.TFrame")
 
+    def switch_workspace(self, name):
+        set_active_workspace(name)
+        self.workspace_var.set(name)
+        self.workspace_box.configure(values=list_workspaces())
+        self.reminders.load()
+        self.refresh_current_view()
+
+    def refresh_current_view(self):
+        views = {
+            "view": self.open_view_tasks,
+            "add": self.open_add_task,
+            "update": self.open_update_task,
+            "todo": self.open_todo_list,
+            "stats": self.open_stats,
+            "all": self.open_all_workspaces,
+            "settings": self.open_settings,
+        }
+        views.get(self.current_view, self.show_welcome)()
+
+    def undo_change(self):
+        self._step_history(undo_last_change, "Undo", "Undid")
+
+    def redo_change(self):
+        self._step_history(redo_last_change, "Redo", "Redid")
+
+    def _step_history(self, step, title, verb):
+        try:
+            entries = step()
+        except (sqlite3.Error, ValueError) as exc:
+            messagebox.showerror(f"{title} Failed", str(exc))
+            return
+        if entries is None:
+            messagebox.showinfo(title, f"Nothing to {title.lower()}.")
+            return
+        self.reminders.load()
+        if self.current_view not in ("add", "settings", "welcome"):
+            self.refresh_current_view()
+        messagebox.showinfo(title, f"{verb} {describe_changes(entries)}.")
+
+    def create_workspace(self):
+        name = simpledialog.askstring("New Workspace", "Workspace name:", parent=self.root)
+        if name is None:
+            return
+        name = name.strip()
+        if not is_valid_workspace_name(name):
+            messagebox.showwarning("Invalid name", "Use up to 40 letters, digits, spaces, '-' or '_'.")
+            return
+        self.switch_workspace(name)
+
     def clear_content(self):
         for widget in self.content.winfo_children():
             widget.destroy()
@@ -363,21 +1592,73 @@ class TaskApp:
         due_entry = DateEntry(form, width=18, date_pattern="yyyy-mm-dd")
         due_entry.grid(row=2, column=1, sticky="w", pady=6, padx=8)
 
+        ttk.Label(form, text="Priority:").grid(row=3, column=0, sticky="w", pady=6)
+        priority_var = tk.StringVar(value=priority_name(DEFAULT_PRIORITY))
+        priority_box = ttk.Combobox(form, textvariable=priority_var, values=list(PRIORITY_LEVELS), state="readonly", width=16)
+        priority_box.grid(row=3, column=1, sticky="w", pady=6, padx=8)
+
+        btns = ttk.Frame(self.content, style="Surface.TFrame")
+        btns.pack(pady=12)
+
+        quick_card = ttk.Frame(self.content, padding=16, style="Card.TFrame")
+        quick_card.pack(padx=10, pady=4, fill="x", anchor="n")
+        ttk.Label(quick_card, text="Quick Add — one task per line, optional @YYYY-MM-DD due date:",
+                  background=self.surface_alt_color).pack(anchor="w")
+        quick_text = tk.Text(quick_card, height=4, relief="flat", bd=0, wrap="none")
+        quick_text.pack(fill="x", pady=(6, 6))
+        quick_text.configure(bg=self.surface_color, fg=self.on_surface, insertbackground=self.on_surface)
+
+        ttk.Label(self.content, text="Recently Added", font=self.font_subheading).pack(anchor="w", padx=10, pady=(8, 4))
+        added_status = tk.StringVar(value="")
+        list_frame = ttk.Frame(self.content, style="Card.TFrame")
+        list_frame.pack(fill="both", expand=True, padx=10, pady=(0, 4))
+        cols = ("ID", "Title", "Due Date", "Priority")
+        added_tree = ttk.Treeview(list_frame, columns=cols, show="headings", selectmode="browse", height=5)
+        for col in cols:
+            added_tree.heading(col, text=col)
+        added_tree.column("ID", width=60, anchor="center")
+        added_tree.column("Title", width=420, anchor="w")
+        added_tree.column("Due Date", width=120, anchor="center")
+        added_tree.column("Priority", width=90, anchor="center")
+        added_tree.pack(fill="both", expand=True, padx=4, pady=4)
+
+        def show_added(entries):
+            for tid, title, due_s, priority in entries:
+                added_tree.insert("", 0, values=(tid, title, due_s or "-", priority_name(priority)))
+                self.reminders.schedule(tid, title, due_s, "Pending")
+            added_status.set(f"Added {len(entries)} task{'s' if len(entries) != 1 else ''}.")
+
         def save_task():
             title = title_entry.get().strip()
             desc = desc_entry.get("1.0", tk.END).strip()
             due = due_entry.get_date().strftime("%Y-%m-%d")
+            priority = PRIORITY_LEVELS[priority_var.get()]
             if not title:
                 messagebox.showwarning("Input Error", "Title is required.")
                 return
-            add_task_db(title, desc, due, "Pending")
-            messagebox.showinfo("Saved", "Task added successfully.")
-            self.open_view_tasks()
+            tid = add_task_db(title, desc, due, "Pending", priority=priority)
+            show_added([(tid, title, due, priority)])
+            title_entry.delete(0, tk.END)
+            desc_entry.delete("1.0", tk.END)
+            title_entry.focus_set()
+
+        def quick_add():
+            try:
+                items = parse_quick_add(quick_text.get("1.0", tk.END))
+            except ValueError as exc:
+                messagebox.showwarning("Input Error", str(exc))
+                return
+            if not items:
+                messagebox.showwarning("Input Error", "Enter at least one task.")
+                return
+            ids = add_tasks_db(items)
+            show_added([(tid, title, due_s, DEFAULT_PRIORITY) for tid, (title, due_s) in zip(ids, items)])
+            quick_text.delete("1.0", tk.END)
 
-        btns = ttk.Frame(self.content, style="Surface.TFrame")
-        btns.pack(pady=12)
         ttk.Button(btns, text="Save Task", command=save_task).pack(side="left", padx=6)
         ttk.Button(btns, text="Back", command=self.show_welcome, style="Secondary.TButton").pack(side="left", padx=6)
+        ttk.Label(btns, textvariable=added_status).pack(side="left", padx=8)
+        ttk.Button(quick_card, text="Add All", command=quick_add).pack(anchor="e")
 
     def open_view_tasks(self):
         self.apply_theme()
@@ -415,19 +1696,23 @@ class TaskApp:
 
         draw_legend()
 
-        def refresh_calendar_markers():
+        day_cache = {}
+        cached_range = [None, None]
+
+        def refresh_calendar_markers(day_s=None):
             try:
-                for event_id in cal.get_calevents():
+                day_d = iso_to_date(day_s) if day_s else None
+                for event_id in cal.get_calevents(date=day_d) if day_d else cal.get_calevents():
                     cal.calevent_remove(event_id)
             except Exception:
                 pass
-            rows = fetch_all_tasks_db()
-            for row in rows:
-                _, title, _, due_s, status, _ = row
-                if due_s:
+            days = [day_s] if day_s else list(day_cache)
+            for key_s in days:
+                for row in day_cache.get(key_s, []):
+                    _, title, due_s, status, _, _ = row
                     try:
                         due_d = datetime.strptime(due_s, "%Y-%m-%d").date()
-                        cal.calevent_create(due_d, f"{status}: {title}", status.lower())
+                        cal.calevent_create(due_d, f"{status}: {title}", (status or "").lower())
                     except Exception:
                         continue
             for key in ("done", "pending", "missed"):
@@ -443,19 +1728,51 @@ class TaskApp:
                         selectbackground=adjust_color(self.primary_color, -0.2), font=self.font_body)
         sel_tasks_list.pack(fill="x", padx=4, pady=6)
 
+        def prefetch_visible_month(evt=None):
+            month, year = cal.get_displayed_month()
+            first = date(year, month, 1)
+            start_s = (first - timedelta(days=7)).strftime("%Y-%m-%d")
+            end_s = (first + timedelta(days=49)).strftime("%Y-%m-%d")
+            day_cache.clear()
+            for row in fetch_task_summaries_between(start_s, end_s):
+                day_cache.setdefault(row[2], []).append(row)
+            cached_range[:] = [start_s, end_s]
+            refresh_calendar_markers()
+
+        def tasks_for_day(day_s):
+            if cached_range[0] and cached_range[0] <= day_s < cached_range[1]:
+                return day_cache.get(day_s, [])
+            return fetch_task_summaries_by_date(day_s)
+
+        def patch_cached_task(task_id, due_s, new_status=None):
+            rows = day_cache.get(due_s, [])
+            for idx, row in enumerate(rows):
+                if row[0] == task_id:
+                    if new_status is None:
+                        del rows[idx]
+                    else:
+                        rows[idx] = row[:3] + (new_status,) + row[4:]
+                    break
+            else:
+                return
+            refresh_calendar_markers(due_s)
+            if cal.get_date() == due_s:
+                show_tasks_for_selected_date()
+
         def show_tasks_for_selected_date(evt=None):
             sel_tasks_list.delete(0, tk.END)
-            rows = fetch_tasks_by_date(cal.get_date())
+            rows = tasks_for_day(cal.get_date())
             if not rows:
                 sel_tasks_list.insert(tk.END, "No tasks for this date.")
                 return
             for r in rows:
-                tid, title, _, _, status, _ = r
+                tid, title, _, status, _, _ = r
                 prefix = {"Done": "🟢", "Pending": "🟡", "Missed": "🔴"}.get(status, "⬜")
                 sel_tasks_list.insert(tk.END, f"{prefix} [{tid}] {title} — {status}")
 
         cal.bind("<<CalendarSelected>>", show_tasks_for_selected_date)
-        refresh_calendar_markers()
+        cal.bind("<<CalendarMonthChanged>>", prefetch_visible_month)
+        prefetch_visible_month()
         cal.selection_set(date.today().strftime("%Y-%m-%d"))
         show_tasks_for_selected_date()
 
@@ -476,8 +1793,8 @@ class TaskApp:
         def populate_pending_missed():
             for item in tree.get_children():
                 tree.delete(item)
-            for r in fetch_tasks_by_statuses(["Pending", "Missed"]):
-                tid, title, _, due_s, status, _ = r
+            for r in fetch_task_summaries_by_statuses(["Pending", "Missed"]):
+                tid, title, due_s, status, _, _ = r
                 tree.insert("", "end", values=(tid, title, due_s, status), tags=(status.lower(),))
             tree.tag_configure("missed", background=self.get_status_color("Missed"))
             tree.tag_configure("pending", background=self.get_status_color("Pending"))
@@ -492,10 +1809,11 @@ class TaskApp:
             if not sel:
                 messagebox.showwarning("Selection Required", "Please select a task.")
                 return
-            task_id = tree.item(sel[0])["values"][0]
+            task_id, title, due_s, _ = tree.item(sel[0])["values"]
             update_task_status_db(task_id, new_status)
+            self.reminders.schedule(task_id, title, due_s, new_status)
             populate_pending_missed()
-            refresh_calendar_markers()
+            patch_cached_task(task_id, due_s, new_status)
             messagebox.showinfo("Updated", f"Task #{task_id} set to {new_status}.")
 
         def delete_selected():
@@ -503,17 +1821,18 @@ class TaskApp:
             if not sel:
                 messagebox.showwarning("Selection Required", "Please select a task.")
                 return
-            task_id = tree.item(sel[0])["values"][0]
+            task_id, _, due_s, _ = tree.item(sel[0])["values"]
             if messagebox.askyesno("Confirm", f"Delete task #{task_id}?"):
                 delete_task_db(task_id)
+                self.reminders.cancel(task_id)
                 populate_pending_missed()
-                refresh_calendar_markers()
+                patch_cached_task(task_id, due_s)
 
         ttk.Button(btns, text="Set to Done", command=lambda: set_selected_status("Done")).pack(side="left", padx=4)
         ttk.Button(btns, text="Set to Pending", command=lambda: set_selected_status("Pending")).pack(side="left", padx=4)
         ttk.Button(btns, text="Delete Task", command=delete_selected, style="Secondary.TButton").pack(side="left", padx=4)
         ttk.Button(btns, text="Refresh",
-                   command=lambda: (mark_missed_tasks(), populate_pending_missed(), refresh_calendar_markers()),
+                   command=lambda: (mark_missed_tasks(), populate_pending_missed(), prefetch_visible_month(), show_tasks_for_selected_date()),
                    style="Secondary.TButton").pack(side="left", padx=4)
         ttk.Button(btns, text="Back to Menu", command=self.show_welcome, style="Secondary.TButton").pack(side="right", padx=4)
 
@@ -532,7 +1851,7 @@ class TaskApp:
         right = ttk.Frame(main_frame, style="Card.TFrame")
         right.pack(side="left", fill="both", expand=True)
 
-        cols = ("ID", "Title", "Due Date", "Status")
+        cols = ("ID", "Title", "Due Date", "Status", "Priority")
         tree = ttk.Treeview(left, columns=cols, show="headings", selectmode="browse")
         for c in cols:
             tree.heading(c, text=c)
@@ -540,13 +1859,14 @@ class TaskApp:
         tree.column("Title", width=260)
         tree.column("Due Date", width=120)
         tree.column("Status", width=90)
+        tree.column("Priority", width=80)
         tree.pack(fill="both", expand=True, padx=6, pady=6)
 
         def populate():
             for item in tree.get_children():
                 tree.delete(item)
-            for r in fetch_all_tasks_db():
-                tree.insert("", "end", values=(r[0], r[1], r[3], r[4]))
+            for r in fetch_all_task_summaries_db():
+                tree.insert("", "end", values=(r[0], r[1], r[2], r[3], priority_name(r[5])))
 
         populate()
 
@@ -580,27 +1900,29 @@ class TaskApp:
         status_box.grid(row=4, column=1, sticky="w", pady=4)
         status_box.current(0)
 
+        ttk.Label(form, text="Priority:").grid(row=5, column=0, sticky="w", pady=4)
+        priority_var = tk.StringVar(value=priority_name(DEFAULT_PRIORITY))
+        priority_box = ttk.Combobox(form, textvariable=priority_var, values=list(PRIORITY_LEVELS), state="readonly", width=16)
+        priority_box.grid(row=5, column=1, sticky="w", pady=4)
+
         def on_tree_select(evt=None):
             sel = tree.selection()
             if not sel:
                 return
-            item = tree.item(sel[0])["values"]
-            tid = item[0]
-            rows = [r for r in fetch_all_tasks_db() if r[0] == tid]
-            if not rows:
-                return
-            r = rows[0]
-            id_var.set(r[0])
-            title_var.set(r[1])
+            tid, title, due_s, status, priority = tree.item(sel[0])["values"]
+            desc = fetch_task_description_db(tid)
+            id_var.set(tid)
+            title_var.set(title)
             desc_text.delete("1.0", tk.END)
-            if r[2]:
-                desc_text.insert(tk.END, r[2])
-            if r[3]:
+            if desc:
+                desc_text.insert(tk.END, desc)
+            if due_s:
                 try:
-                    due_entry.set_date(datetime.strptime(r[3], "%Y-%m-%d").date())
+                    due_entry.set_date(datetime.strptime(due_s, "%Y-%m-%d").date())
                 except Exception:
                     pass
-            status_var.set(r[4])
+            status_var.set(status)
+            priority_var.set(priority)
 
         tree.bind("<<TreeviewSelect>>", on_tree_select)
 
@@ -613,10 +1935,12 @@ class TaskApp:
             desc = desc_text.get("1.0", tk.END).strip()
             due = due_entry.get_date().strftime("%Y-%m-%d")
             status = status_var.get()
+            priority = PRIORITY_LEVELS[priority_var.get()]
             if not title:
                 messagebox.showwarning("Input Error", "Title is required.")
                 return
-            update_task_db(tid, title, desc, due, status)
+            update_task_db(tid, title, desc, due, status, priority)
+            self.reminders.schedule(tid, title, due, status)
             messagebox.showinfo("Saved", f"Task #{tid} updated.")
             populate()
 
@@ -630,7 +1954,8 @@ class TaskApp:
         self.apply_theme()
         self.current_view = "todo"
         self.clear_content()
-        ttk.Label(self.content, text="💖 To-Do List (Manual / Sort / Priority)", style="Heading.TLabel").pack(anchor="w", padx=10, pady=(4, 10))
+        heading = ttk.Label(self.content, text="💖 To-Do List (Manual / Sort / Priority)", style="Heading.TLabel")
+        heading.pack(anchor="w", padx=10, pady=(4, 10))
 
         mark_missed_tasks()
 
@@ -642,8 +1967,9 @@ class TaskApp:
         order_box.pack(side="left")
         order_box.current(0)
 
-        ttk.Button(ctrl_frame, text="Save Order",
-                   command=lambda: self.save_manual_order(getattr(self, "_todo_rows_container", []))).pack(side="left", padx=6)
+        save_btn = ttk.Button(ctrl_frame, text="Save Order",
+                              command=lambda: self.save_manual_order(getattr(self, "_todo_rows_container", [])))
+        save_btn.pack(side="left", padx=6)
         ttk.Button(ctrl_frame, text="Refresh", command=self.open_todo_list, style="Secondary.TButton").pack(side="left", padx=6)
         ttk.Button(ctrl_frame, text="Back", command=self.show_welcome, style="Secondary.TButton").pack(side="right", padx=6)
 
@@ -702,29 +2028,34 @@ class TaskApp:
                 child.destroy()
             rows_container.clear()
 
-            raw = fetch_all_tasks_db()
+            mode = order_var.get()
+            raw = fetch_top_tasks_db(TOP_TASKS_LIMIT) if mode == "Priority" else fetch_all_task_summaries_db()
+            reorder_state = "disabled" if mode == "Priority" else "normal"
+            save_btn.configure(state=reorder_state)
+            if mode == "Priority":
+                heading.configure(text=f"💖 To-Do List (Top {TOP_TASKS_LIMIT} by Priority)")
+            else:
+                heading.configure(text="💖 To-Do List (Manual / Sort / Priority)")
             normed = []
             for r in raw:
-                tid, title, desc, due_s, status, order_index = r
+                tid, title, due_s, status, order_index, _ = r
                 ordering = order_index if order_index else tid
                 due_dt = iso_to_date(due_s)
-                normed.append((tid, title, desc, due_s, status, ordering, due_dt))
+                normed.append((tid, title, due_s, status, ordering, due_dt))
 
-            mode = order_var.get()
             if mode == "Due Date Asc":
-                normed.sort(key=lambda item: (status_priority.get(item[4], 3), item[6].toordinal() if item[6] else date.max.toordinal()))
+                normed.sort(key=lambda item: (status_priority.get(item[3], 3), item[5].toordinal() if item[5] else date.max.toordinal()))
             elif mode == "Due Date Desc":
-                normed.sort(key=lambda item: (status_priority.get(item[4], 3), - (item[6].toordinal() if item[6] else date.min.toordinal())))
+                normed.sort(key=lambda item: (status_priority.get(item[3], 3), - (item[5].toordinal() if item[5] else date.min.toordinal())))
             elif mode == "Priority":
-                normed.sort(key=lambda item: (status_priority.get(item[4], 3), item[6].toordinal() if item[6] else date.max.toordinal()))
+                pass
             else:
-                normed.sort(key=lambda item: item[5])
+                normed.sort(key=lambda item: item[4])
 
-            for idx, (tid, title, desc, due_s, status, ordering, due_dt) in enumerate(normed):
+            for idx, (tid, title, due_s, status, ordering, due_dt) in enumerate(normed):
                 row_data = {
                     "tid": tid,
                     "title": title,
-                    "description": desc,
                     "due_str": due_s,
                     "due_date": due_dt,
                     "status": status,
@@ -732,37 +2063,40 @@ class TaskApp:
                 var = tk.BooleanVar(value=(status == "Done"))
                 row_data["var"] = var
 
-                row_frame = tk.Frame(scroll_frame, bg=self.surface_alt_color, bd=0, highlightthickness=1,
-                                     highlightbackground=adjust_color(self.secondary_color, -0.2), padx=6, pady=8)
+                row_frame = ttk.Frame(scroll_frame, style=self._status_style(status, "TFrame"), padding=(6, 4))
                 row_frame.grid(row=idx, column=0, sticky="ew", padx=4, pady=4)
-                row_frame.columnconfigure(1, weight=1)
+                row_frame.columnconfigure(0, weight=1)
                 row_data["frame"] = row_frame
 
-                chk = tk.Checkbutton(row_frame, variable=var, bd=0, highlightthickness=0, onvalue=True, offvalue=False,
-                                     bg=self.surface_alt_color, activebackground=self.surface_alt_color,
-                                     selectcolor=self.checkbox_fill, width=2)
+                body = ttk.Frame(row_frame, style="TodoRow.TFrame", padding=(0, 4))
+                body.grid(row=0, column=0, sticky="ew")
+                body.columnconfigure(1, weight=1)
+
+                chk = ttk.Checkbutton(body, variable=var, onvalue=True, offvalue=False, style="TodoRow.TCheckbutton")
                 chk.grid(row=0, column=0, sticky="w", padx=(4, 8))
                 row_data["checkbutton"] = chk
 
-                title_lbl = tk.Label(row_frame, text=title or "(Untitled Task)", anchor="w", bg=self.surface_alt_color,
-                                     fg=self.on_surface, font=self.font_subheading)
+                title_lbl = ttk.Label(body, text=title or "(Untitled Task)", anchor="w", style="TodoRow.TLabel",
+                                      font=self.font_subheading)
                 title_lbl.grid(row=0, column=1, sticky="ew", padx=4, pady=2)
                 row_data["title_lbl"] = title_lbl
 
-                due_lbl = tk.Label(row_frame, text=due_s or "-", width=14, anchor="center", bg=self.surface_alt_color, fg=self.on_surface, font=self.font_body)
+                due_lbl = ttk.Label(body, text=due_s or "-", width=14, anchor="center", style="TodoRow.TLabel")
                 due_lbl.grid(row=0, column=2, padx=6)
                 row_data["due_lbl"] = due_lbl
 
-                status_lbl = tk.Label(row_frame, text=status or "-", width=10, anchor="center", bg=self.surface_alt_color, fg=self.on_surface, font=self.font_body)
+                status_lbl = ttk.Label(body, text=status or "-", width=10, anchor="center", style="TodoRow.TLabel")
                 status_lbl.grid(row=0, column=3, padx=6)
                 row_data["status_lbl"] = status_lbl
 
-                btns = tk.Frame(row_frame, bg=self.surface_alt_color)
+                btns = ttk.Frame(body, style="TodoRow.TFrame", relief="flat", borderwidth=0)
                 btns.grid(row=0, column=4, padx=6)
                 row_data["button_frame"] = btns
 
-                up_btn = ttk.Button(btns, text="↑", width=3, command=lambda item=row_data: move_row_up(item), style="Secondary.TButton")
-                down_btn = ttk.Button(btns, text="↓", width=3, command=lambda item=row_data: move_row_down(item), style="Secondary.TButton")
+                up_btn = ttk.Button(btns, text="↑", width=3, command=lambda item=row_data: move_row_up(item),
+                                    style="Secondary.TButton", state=reorder_state)
+                down_btn = ttk.Button(btns, text="↓", width=3, command=lambda item=row_data: move_row_down(item),
+                                      style="Secondary.TButton", state=reorder_state)
                 edit_btn = ttk.Button(btns, text="Edit", width=6, command=lambda task_id=tid: self.open_update_from_todo(task_id))
                 up_btn.pack(side="left", padx=(0, 4))
                 down_btn.pack(side="left", padx=(0, 4))
@@ -776,7 +2110,6 @@ class TaskApp:
                 chk.configure(command=on_check)
 
                 rows_container.append(row_data)
-                self._apply_row_status_styles(row_data, status)
 
         order_box.bind("<<ComboboxSelected>>", lambda _evt: load_rows())
         load_rows()
@@ -817,6 +2150,124 @@ class TaskApp:
                 tree.event_generate("<<TreeviewSelect>>")
                 break
 
+    def open_stats(self):
+        self.apply_theme()
+        self.current_view = "stats"
+        self.clear_content()
+        ttk.Label(self.content, text="Statistics", style="Heading.TLabel").pack(anchor="w", padx=10, pady=(4, 10))
+
+        summary = ttk.Frame(self.content, padding=16, style="Card.TFrame")
+        summary.pack(fill="x", padx=6, pady=4)
+
+        ttk.Label(self.content, text="Completion by Due Week", font=self.font_subheading).pack(anchor="w", padx=6, pady=(12, 4))
+        list_frame = ttk.Frame(self.content, style="Card.TFrame")
+        list_frame.pack(fill="both", expand=True, padx=6, pady=(0, 10))
+
+        cols = ("Week Of", "Tasks", "Done", "Completion")
+        tree = ttk.Treeview(list_frame, columns=cols, show="headings", selectmode="browse")
+        for col in cols:
+            tree.heading(col, text=col)
+            tree.column(col, width=140, anchor="center")
+        tree.pack(fill="both", expand=True, padx=4, pady=4)
+
+        def populate():
+            for child in summary.winfo_children():
+                child.destroy()
+            for item in tree.get_children():
+                tree.delete(item)
+
+            status_rows, week_rows = fetch_stats_db()
+            counts = dict(status_rows)
+            total = sum(counts.values())
+            done = counts.get("Done", 0)
+            cells = [("Total", total)] + [(s or "(none)", n) for s, n in status_rows]
+            cells.append(("Completion", f"{(done / total * 100) if total else 0:.0f}%"))
+            for idx, (label, value) in enumerate(cells):
+                cell = tk.Frame(summary, bg=self.get_status_color(label), padx=14, pady=8)
+                cell.grid(row=0, column=idx, padx=4, sticky="nsew")
+                tk.Label(cell, text=str(value), bg=cell["bg"], fg=self.on_surface, font=self.font_heading).pack()
+                tk.Label(cell, text=label, bg=cell["bg"], fg=self.on_surface, font=self.font_body).pack()
+
+            for week_start, task_count, done_count in week_rows:
+                rate = done_count / task_count * 100 if task_count else 0
+                tree.insert("", "end", values=(week_start or "No due date", task_count, done_count, f"{rate:.0f}%"))
+
+        def rebuild():
+            rebuild_stats_db()
+            populate()
+            messagebox.showinfo("Rebuilt", "Statistics recomputed from all tasks.")
+
+        populate()
+
+        btns = ttk.Frame(self.content, style="Surface.TFrame")
+        btns.pack(pady=8)
+        ttk.Button(btns, text="Refresh", command=populate, style="Secondary.TButton").pack(side="left", padx=4)
+        ttk.Button(btns, text="Rebuild Statistics", command=rebuild, style="Secondary.TButton").pack(side="left", padx=4)
+        ttk.Button(btns, text="Back to Menu", command=self.show_welcome, style="Secondary.TButton").pack(side="right", padx=4)
+
+    def open_all_workspaces(self):
+        self.apply_theme()
+        self.current_view = "all"
+        self.clear_content()
+        ttk.Label(self.content, text="All Workspaces", style="Heading.TLabel").pack(anchor="w", padx=10, pady=(4, 10))
+
+        list_frame = ttk.Frame(self.content, style="Card.TFrame")
+        list_frame.pack(fill="both", expand=True, padx=6, pady=(0, 10))
+
+        cols = ("Workspace", "ID", "Title", "Due Date", "Status")
+        tree = ttk.Treeview(list_frame, columns=cols, show="headings", selectmode="browse")
+        for col in cols:
+            tree.heading(col, text=col)
+        tree.column("Workspace", width=130, anchor="w")
+        tree.column("ID", width=60, anchor="center")
+        tree.column("Title", width=340, anchor="w")
+        tree.column("Due Date", width=120, anchor="center")
+        tree.column("Status", width=100, anchor="center")
+        tree.pack(fill="both", expand=True, padx=4, pady=4)
+
+        page_cursors = [None]
+        page_state = {"next": None}
+        page_label = tk.StringVar()
+
+        def show_page():
+            for item in tree.get_children():
+                tree.delete(item)
+            rows = fetch_cross_workspace_page(page_cursors[-1], WORKSPACE_PAGE_SIZE + 1)
+            page_state["next"] = None
+            if len(rows) > WORKSPACE_PAGE_SIZE:
+                rows = rows[:WORKSPACE_PAGE_SIZE]
+                last = rows[-1]
+                page_state["next"] = (last[0], last[1], last[2])
+            for _, workspace, tid, title, due_s, status in rows:
+                tree.insert("", "end", values=(workspace, tid, title, due_s or "-", status),
+                            tags=((status or "").lower(),))
+            for key in ("done", "pending", "missed"):
+                tree.tag_configure(key, background=self.get_status_color(key.capitalize()))
+            page_label.set(f"Page {len(page_cursors)}")
+            prev_btn.configure(state="normal" if len(page_cursors) > 1 else "disabled")
+            next_btn.configure(state="normal" if page_state["next"] else "disabled")
+
+        def next_page():
+            if page_state["next"]:
+                page_cursors.append(page_state["next"])
+                show_page()
+
+        def prev_page():
+            if len(page_cursors) > 1:
+                page_cursors.pop()
+                show_page()
+
+        btns = ttk.Frame(self.content, style="Surface.TFrame")
+        btns.pack(fill="x", pady=8, padx=6)
+        prev_btn = ttk.Button(btns, text="Previous", command=prev_page, style="Secondary.TButton")
+        prev_btn.pack(side="left", padx=4)
+        next_btn = ttk.Button(btns, text="Next", command=next_page, style="Secondary.TButton")
+        next_btn.pack(side="left", padx=4)
+        ttk.Label(btns, textvariable=page_label).pack(side="left", padx=8)
+        ttk.Button(btns, text="Back to Menu", command=self.show_welcome, style="Secondary.TButton").pack(side="right", padx=4)
+
+        show_page()
+
     def open_settings(self):
         self.apply_theme()
         self.current_view = "settings"
@@ -889,6 +2340,111 @@ class TaskApp:
 
         update_preview()
 
+        ttk.Label(self.content, text="Backups", style="Heading.TLabel").pack(anchor="w", padx=10, pady=(16, 10))
+        backup_card = ttk.Frame(self.content, padding=18, style="Card.TFrame")
+        backup_card.pack(fill="x", padx=12, pady=6)
+
+        snapshot_var = tk.StringVar()
+        backup_status = tk.StringVar(value="")
+
+        snap_row = ttk.Frame(backup_card, style="Card.TFrame")
+        snap_row.pack(fill="x", pady=6)
+        ttk.Label(snap_row, text="Snapshot:").pack(side="left")
+        snapshot_box = ttk.Combobox(snap_row, textvariable=snapshot_var, state="readonly", width=44)
+        snapshot_box.pack(side="left", padx=6)
+
+        def refresh_snapshots():
+            names = [os.path.basename(path) for path in list_snapshots()]
+            snapshot_box.configure(values=names)
+            snapshot_var.set(names[0] if names else "")
+
+        def set_busy(busy):
+            state = "disabled" if busy else "normal"
+            backup_btn.configure(state=state)
+            restore_btn.configure(state=state)
+
+        def show_progress(done, total):
+            if backup_card.winfo_exists():
+                backup_status.set(f"Copying pages {done}/{total}...")
+
+        def backup_now():
+            set_busy(True)
+            backup_status.set("Backing up...")
+
+            def finished(path, error):
+                if not backup_card.winfo_exists():
+                    return
+                set_busy(False)
+                if error:
+                    backup_status.set("")
+                    messagebox.showerror("Backup Failed", str(error))
+                    return
+                backup_status.set(f"Saved {os.path.basename(path)}")
+                refresh_snapshots()
+
+            self.start_backup(finished, show_progress)
+
+        def restore_selected():
+            name = snapshot_var.get()
+            if not name:
+                messagebox.showwarning("Select", "Please choose a snapshot to restore.")
+                return
+            if not messagebox.askyesno("Restore", f"Replace all current tasks with {name}?"):
+                return
+            path = os.path.join(snapshot_dir(), name)
+            set_busy(True)
+            backup_status.set("Restoring...")
+
+            def finished(_, error):
+                if error:
+                    if backup_card.winfo_exists():
+                        set_busy(False)
+                        backup_status.set("")
+                    messagebox.showerror("Restore Failed", str(error))
+                    return
+                self.reminders.load()
+                messagebox.showinfo("Restored", f"Tasks restored from {name}.")
+                self.show_welcome()
+
+            self.run_in_background(lambda: restore_snapshot(path), finished)
+
+        action_row2 = ttk.Frame(backup_card, style="Card.TFrame")
+        action_row2.pack(fill="x", pady=(12, 0))
+        backup_btn = ttk.Button(action_row2, text="Back Up Now", command=backup_now)
+        backup_btn.pack(side="left", padx=4)
+        restore_btn = ttk.Button(action_row2, text="Restore Snapshot", command=restore_selected, style="Secondary.TButton")
+        restore_btn.pack(side="left", padx=4)
+        ttk.Label(action_row2, textvariable=backup_status, background=self.surface_alt_color).pack(side="left", padx=8)
+
+        refresh_snapshots()
+
+        ttk.Label(self.content, text="Database Maintenance", style="Heading.TLabel").pack(anchor="w", padx=10, pady=(16, 10))
+        maint_card = ttk.Frame(self.content, padding=18, style="Card.TFrame")
+        maint_card.pack(fill="x", padx=12, pady=6)
+        maint_status = tk.StringVar(value=self.last_maintenance_report or "No maintenance run yet this session.")
+
+        def run_now():
+            maint_btn.configure(state="disabled")
+            maint_status.set("Reclaiming free pages and refreshing statistics...")
+
+            def finished(result, error):
+                if not maint_card.winfo_exists():
+                    return
+                maint_btn.configure(state="normal")
+                if error:
+                    maint_status.set("")
+                    messagebox.showerror("Maintenance Failed", str(error))
+                    return
+                self.last_maintenance_report = format_maintenance_report(*result)
+                maint_status.set(self.last_maintenance_report)
+
+            self.run_in_background(run_maintenance, finished)
+
+        maint_btn = ttk.Button(maint_card, text="Run Maintenance", command=run_now)
+        maint_btn.pack(side="left", padx=4)
+        ttk.Label(maint_card, textvariable=maint_status, background=self.surface_alt_color,
+                  wraplength=520).pack(side="left", padx=8)
+
     def get_status_color(self, status):
         return self.status_palette.get(status, self.surface_alt_color)
 
@@ -902,27 +2458,110 @@ class TaskApp:
         is_checked = bool(row["var"].get())
         new_status = "Done" if is_checked else self._status_after_uncheck(row.get("due_date"))
         update_task_status_db(row["tid"], new_status)
+        self.reminders.schedule(row["tid"], row["title"], row["due_str"], new_status)
         row["status"] = new_status
         self._apply_row_status_styles(row, new_status)
 
+    def _status_style(self, status, widget_class):
+        key = status if status in self.status_palette else "Other"
+        return f"{key}.TodoRow.{widget_class}"
+
+    def _configure_status_styles(self):
+        style = self.style
+        fills = dict(self.status_palette, Other=self.surface_alt_color)
+        for key, fill in fills.items():
+            border = adjust_color(fill, -0.25)
+            style.configure(f"{key}.TodoRow.TFrame", background=fill, relief="solid", borderwidth=1,
+                            bordercolor=border, lightcolor=border, darkcolor=border)
+        style.configure("TodoRow.TFrame", background=self.surface_color)
+        style.configure("TodoRow.TLabel", background=self.surface_color, foreground=self.on_surface, font=self.font_body)
+        style.configure("TodoRow.TCheckbutton", background=self.surface_color, foreground=self.on_surface)
+        style.map("TodoRow.TCheckbutton",
+                  background=[("active", self.surface_color)],
+                  indicatorbackground=[("selected", adjust_color(self.primary_color, 0.4)), ("!selected", self.surface_color)])
+
     def _apply_row_status_styles(self, row, status):
-        fill = self.get_status_color(status)
-        border = adjust_color(fill, -0.25)
-        row["frame"].configure(bg=fill, highlightbackground=border)
-        row["title_lbl"].configure(bg=fill, fg=self.on_surface)
-        row["due_lbl"].configure(bg=fill, fg=self.on_surface)
-        row["status_lbl"].configure(bg=fill, fg=self.on_surface, text=status)
-        row["button_frame"].configure(bg=fill)
-        row["checkbutton"].configure(bg=fill, activebackground=fill, selectcolor=adjust_color(fill, -0.15))
+        row["frame"].configure(style=self._status_style(status, "TFrame"))
+        row["status_lbl"].configure(text=status)
         if row["var"].get() != (status == "Done"):
             row["var"].set(status == "Done")
 
+    def notify_reminder(self, task_id, title, due_s):
+        messagebox.showinfo("Reminder", f"Task #{task_id} \"{title}\" is due {due_s}.")
+
     def on_exit(self):
         if messagebox.askyesno("Exit", "Exit application?"):
+            try:
+                run_maintenance()
+            except sqlite3.Error:
+                pass
+            close_connection_pool()
             self.root.destroy()
 
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TaskApp(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="Task Management System")
+    parser.add_argument("--workspace", default=DEFAULT_WORKSPACE, help="workspace used by the command-line options")
+    parser.add_argument("--reminders", action="store_true", help="run the due-soon reminder scheduler without the GUI")
+    parser.add_argument("--rebuild-stats", action="store_true", help="recompute the statistics tables from all tasks")
+    parser.add_argument("--backup", action="store_true", help="write a rotating snapshot of the task database")
+    parser.add_argument("--restore", metavar="SNAPSHOT", help="restore the task database from a snapshot file")
+    parser.add_argument("--maintain", action="store_true", help="reclaim free pages and refresh query statistics")
+    parser.add_argument("--export-journal", type=int, metavar="SEQ",
+                        help="write journal operations after SEQ to stdout as JSON lines")
+    parser.add_argument("--apply-journal", metavar="FILE", help="replay exported journal operations ('-' for stdin)")
+    parser.add_argument("--trim-journal", type=int, metavar="SEQ",
+                        help="drop journal operations up to SEQ once every copy has synced past it")
+    parser.add_argument("--stress", action="store_true", help="run concurrent writers against a scratch database")
+    parser.add_argument("--stress-db", default=STRESS_DB_FILE, help="database file used by --stress")
+    parser.add_argument("--workers", type=int, default=4, help="number of concurrent writers for --stress")
+    parser.add_argument("--ops", type=int, default=200, help="operations per writer for --stress")
+    parser.add_argument("--processes", action="store_true", help="use processes instead of threads for --stress")
+    args, _ = parser.parse_known_args()
+    if args.workspace != DEFAULT_WORKSPACE:
+        if not is_valid_workspace_name(args.workspace):
+            parser.error(f"invalid workspace name: {args.workspace!r}")
+        set_active_workspace(args.workspace)
+    if args.stress:
+        report = run_stress_test(args.stress_db, args.workers, args.ops, args.processes)
+        print(f"{report['workers']} {report['mode']}, {report['operations']} ops in {report['seconds']:.2f}s "
+              f"({report['throughput']:.0f} ops/s)")
+        print(f"latency p50 {report['p50_ms']:.1f} ms, p99 {report['p99_ms']:.1f} ms, max {report['max_ms']:.1f} ms")
+        print(f"lock retries {report['lock_retries']}, failed ops {report['errors']}")
+    elif args.export_journal is not None:
+        init_db()
+        export_journal(sys.stdout, args.export_journal)
+    elif args.trim_journal is not None:
+        init_db()
+        print(f"Removed {trim_journal_db(args.trim_journal)} journal operations; run --maintain to reclaim the space.")
+    elif args.apply_journal:
+        init_db()
+        source = sys.stdin if args.apply_journal == "-" else open(args.apply_journal, encoding="utf-8")
+        with source:
+            entries = [json.loads(line) for line in source if line.strip()]
+        try:
+            applied, synced_seq = apply_journal_entries(entries)
+        except ValueError as exc:
+            parser.error(str(exc))
+        print(f"Applied {applied} of {len(entries)} operations; synced through source seq {synced_seq}.")
+    elif args.maintain:
+        init_db()
+        print(format_maintenance_report(*run_maintenance()))
+    elif args.rebuild_stats:
+        init_db()
+        rebuild_stats_db()
+    elif args.backup:
+        init_db()
+        print(create_snapshot())
+    elif args.restore:
+        try:
+            restore_snapshot(args.restore)
+        except ValueError as exc:
+            parser.error(str(exc))
+    elif args.reminders:
+        init_db()
+        ReminderScheduler(print_reminder).run_forever()
+    else:
+        root = tk.Tk()
+        app = TaskApp(root)
+        root.mainloop()